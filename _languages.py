@@ -0,0 +1,337 @@
+"""
+Supported languages table.
+
+GENERATED by tools/gen_languages.py from tools/languages.json -- do not edit.
+"""
+
+from typing import Dict, FrozenSet, Tuple
+
+
+LANG_NAMES: Dict[str, str] = {
+    'af': 'Afrikaans',
+    'sq': 'Albanian',
+    'am': 'Amharic',
+    'ar': 'Arabic',
+    'hy': 'Armenian',
+    'az': 'Azerbaijani',
+    'eu': 'Basque',
+    'be': 'Belarusian',
+    'bn': 'Bengali',
+    'bs': 'Bosnian',
+    'bg': 'Bulgarian',
+    'ca': 'Catalan',
+    'zh': 'Chinese',
+    'zh-cn': 'Chinese (Simplified)',
+    'zh-tw': 'Chinese (Traditional)',
+    'hr': 'Croatian',
+    'cs': 'Czech',
+    'da': 'Danish',
+    'nl': 'Dutch',
+    'en': 'English',
+    'eo': 'Esperanto',
+    'et': 'Estonian',
+    'fi': 'Finnish',
+    'fr': 'French',
+    'gl': 'Galician',
+    'ka': 'Georgian',
+    'de': 'German',
+    'el': 'Greek',
+    'gu': 'Gujarati',
+    'he': 'Hebrew',
+    'hi': 'Hindi',
+    'hu': 'Hungarian',
+    'is': 'Icelandic',
+    'id': 'Indonesian',
+    'ga': 'Irish',
+    'it': 'Italian',
+    'ja': 'Japanese',
+    'kn': 'Kannada',
+    'kk': 'Kazakh',
+    'km': 'Khmer',
+    'ko': 'Korean',
+    'lo': 'Lao',
+    'lv': 'Latvian',
+    'lt': 'Lithuanian',
+    'mk': 'Macedonian',
+    'ms': 'Malay',
+    'ml': 'Malayalam',
+    'mt': 'Maltese',
+    'mr': 'Marathi',
+    'mn': 'Mongolian',
+    'ne': 'Nepali',
+    'nb': 'Norwegian',
+    'fa': 'Persian',
+    'pl': 'Polish',
+    'pt': 'Portuguese',
+    'pt-br': 'Portuguese (Brazil)',
+    'pt-pt': 'Portuguese (Portugal)',
+    'pa': 'Punjabi',
+    'ro': 'Romanian',
+    'ru': 'Russian',
+    'sr': 'Serbian',
+    'si': 'Sinhala',
+    'sk': 'Slovak',
+    'sl': 'Slovenian',
+    'es': 'Spanish',
+    'sw': 'Swahili',
+    'sv': 'Swedish',
+    'tl': 'Tagalog',
+    'ta': 'Tamil',
+    'te': 'Telugu',
+    'th': 'Thai',
+    'tr': 'Turkish',
+    'uk': 'Ukrainian',
+    'ur': 'Urdu',
+    'uz': 'Uzbek',
+    'vi': 'Vietnamese',
+    'cy': 'Welsh',
+    'yi': 'Yiddish',
+    'zu': 'Zulu',
+}
+
+NATIVE_NAMES: Dict[str, str] = {
+    'af': 'Afrikaans',
+    'sq': 'Shqip',
+    'am': 'አማርኛ',
+    'ar': 'العربية',
+    'hy': 'Հայերեն',
+    'az': 'Azərbaycan dili',
+    'eu': 'Euskara',
+    'be': 'Беларуская',
+    'bn': 'বাংলা',
+    'bs': 'Bosanski',
+    'bg': 'Български',
+    'ca': 'Català',
+    'zh': '中文',
+    'zh-cn': '简体中文',
+    'zh-tw': '繁體中文',
+    'hr': 'Hrvatski',
+    'cs': 'Čeština',
+    'da': 'Dansk',
+    'nl': 'Nederlands',
+    'en': 'English',
+    'eo': 'Esperanto',
+    'et': 'Eesti',
+    'fi': 'Suomi',
+    'fr': 'Français',
+    'gl': 'Galego',
+    'ka': 'ქართული',
+    'de': 'Deutsch',
+    'el': 'Ελληνικά',
+    'gu': 'ગુજરાતી',
+    'he': 'עברית',
+    'hi': 'हिन्दी',
+    'hu': 'Magyar',
+    'is': 'Íslenska',
+    'id': 'Bahasa Indonesia',
+    'ga': 'Gaeilge',
+    'it': 'Italiano',
+    'ja': '日本語',
+    'kn': 'ಕನ್ನಡ',
+    'kk': 'Қазақ тілі',
+    'km': 'ខ្មែរ',
+    'ko': '한국어',
+    'lo': 'ລາວ',
+    'lv': 'Latviešu',
+    'lt': 'Lietuvių',
+    'mk': 'Македонски',
+    'ms': 'Bahasa Melayu',
+    'ml': 'മലയാളം',
+    'mt': 'Malti',
+    'mr': 'मराठी',
+    'mn': 'Монгол',
+    'ne': 'नेपाली',
+    'nb': 'Norsk bokmål',
+    'fa': 'فارسی',
+    'pl': 'Polski',
+    'pt': 'Português',
+    'pt-br': 'Português (Brasil)',
+    'pt-pt': 'Português (Portugal)',
+    'pa': 'ਪੰਜਾਬੀ',
+    'ro': 'Română',
+    'ru': 'Русский',
+    'sr': 'Српски',
+    'si': 'සිංහල',
+    'sk': 'Slovenčina',
+    'sl': 'Slovenščina',
+    'es': 'Español',
+    'sw': 'Kiswahili',
+    'sv': 'Svenska',
+    'tl': 'Tagalog',
+    'ta': 'தமிழ்',
+    'te': 'తెలుగు',
+    'th': 'ไทย',
+    'tr': 'Türkçe',
+    'uk': 'Українська',
+    'ur': 'اردو',
+    'uz': 'Oʻzbekcha',
+    'vi': 'Tiếng Việt',
+    'cy': 'Cymraeg',
+    'yi': 'ייִדיש',
+    'zu': 'isiZulu',
+}
+
+VALID_CODES: FrozenSet[str] = frozenset({
+    'af',
+    'am',
+    'ar',
+    'az',
+    'be',
+    'bg',
+    'bn',
+    'bs',
+    'ca',
+    'cs',
+    'cy',
+    'da',
+    'de',
+    'el',
+    'en',
+    'eo',
+    'es',
+    'et',
+    'eu',
+    'fa',
+    'fi',
+    'fr',
+    'ga',
+    'gl',
+    'gu',
+    'he',
+    'hi',
+    'hr',
+    'hu',
+    'hy',
+    'id',
+    'is',
+    'it',
+    'ja',
+    'ka',
+    'kk',
+    'km',
+    'kn',
+    'ko',
+    'lo',
+    'lt',
+    'lv',
+    'mk',
+    'ml',
+    'mn',
+    'mr',
+    'ms',
+    'mt',
+    'nb',
+    'ne',
+    'nl',
+    'pa',
+    'pl',
+    'pt',
+    'pt-br',
+    'pt-pt',
+    'ro',
+    'ru',
+    'si',
+    'sk',
+    'sl',
+    'sq',
+    'sr',
+    'sv',
+    'sw',
+    'ta',
+    'te',
+    'th',
+    'tl',
+    'tr',
+    'uk',
+    'ur',
+    'uz',
+    'vi',
+    'yi',
+    'zh',
+    'zh-cn',
+    'zh-tw',
+    'zu',
+})
+
+# Sorted by English name
+SUPPORTED_LANGUAGES: Tuple[Dict[str, str], ...] = (
+    {'code': 'af', 'name': 'Afrikaans', 'native_name': 'Afrikaans'},
+    {'code': 'sq', 'name': 'Albanian', 'native_name': 'Shqip'},
+    {'code': 'am', 'name': 'Amharic', 'native_name': 'አማርኛ'},
+    {'code': 'ar', 'name': 'Arabic', 'native_name': 'العربية'},
+    {'code': 'hy', 'name': 'Armenian', 'native_name': 'Հայերեն'},
+    {'code': 'az', 'name': 'Azerbaijani', 'native_name': 'Azərbaycan dili'},
+    {'code': 'eu', 'name': 'Basque', 'native_name': 'Euskara'},
+    {'code': 'be', 'name': 'Belarusian', 'native_name': 'Беларуская'},
+    {'code': 'bn', 'name': 'Bengali', 'native_name': 'বাংলা'},
+    {'code': 'bs', 'name': 'Bosnian', 'native_name': 'Bosanski'},
+    {'code': 'bg', 'name': 'Bulgarian', 'native_name': 'Български'},
+    {'code': 'ca', 'name': 'Catalan', 'native_name': 'Català'},
+    {'code': 'zh', 'name': 'Chinese', 'native_name': '中文'},
+    {'code': 'zh-CN', 'name': 'Chinese (Simplified)', 'native_name': '简体中文'},
+    {'code': 'zh-TW', 'name': 'Chinese (Traditional)', 'native_name': '繁體中文'},
+    {'code': 'hr', 'name': 'Croatian', 'native_name': 'Hrvatski'},
+    {'code': 'cs', 'name': 'Czech', 'native_name': 'Čeština'},
+    {'code': 'da', 'name': 'Danish', 'native_name': 'Dansk'},
+    {'code': 'nl', 'name': 'Dutch', 'native_name': 'Nederlands'},
+    {'code': 'en', 'name': 'English', 'native_name': 'English'},
+    {'code': 'eo', 'name': 'Esperanto', 'native_name': 'Esperanto'},
+    {'code': 'et', 'name': 'Estonian', 'native_name': 'Eesti'},
+    {'code': 'fi', 'name': 'Finnish', 'native_name': 'Suomi'},
+    {'code': 'fr', 'name': 'French', 'native_name': 'Français'},
+    {'code': 'gl', 'name': 'Galician', 'native_name': 'Galego'},
+    {'code': 'ka', 'name': 'Georgian', 'native_name': 'ქართული'},
+    {'code': 'de', 'name': 'German', 'native_name': 'Deutsch'},
+    {'code': 'el', 'name': 'Greek', 'native_name': 'Ελληνικά'},
+    {'code': 'gu', 'name': 'Gujarati', 'native_name': 'ગુજરાતી'},
+    {'code': 'he', 'name': 'Hebrew', 'native_name': 'עברית'},
+    {'code': 'hi', 'name': 'Hindi', 'native_name': 'हिन्दी'},
+    {'code': 'hu', 'name': 'Hungarian', 'native_name': 'Magyar'},
+    {'code': 'is', 'name': 'Icelandic', 'native_name': 'Íslenska'},
+    {'code': 'id', 'name': 'Indonesian', 'native_name': 'Bahasa Indonesia'},
+    {'code': 'ga', 'name': 'Irish', 'native_name': 'Gaeilge'},
+    {'code': 'it', 'name': 'Italian', 'native_name': 'Italiano'},
+    {'code': 'ja', 'name': 'Japanese', 'native_name': '日本語'},
+    {'code': 'kn', 'name': 'Kannada', 'native_name': 'ಕನ್ನಡ'},
+    {'code': 'kk', 'name': 'Kazakh', 'native_name': 'Қазақ тілі'},
+    {'code': 'km', 'name': 'Khmer', 'native_name': 'ខ្មែរ'},
+    {'code': 'ko', 'name': 'Korean', 'native_name': '한국어'},
+    {'code': 'lo', 'name': 'Lao', 'native_name': 'ລາວ'},
+    {'code': 'lv', 'name': 'Latvian', 'native_name': 'Latviešu'},
+    {'code': 'lt', 'name': 'Lithuanian', 'native_name': 'Lietuvių'},
+    {'code': 'mk', 'name': 'Macedonian', 'native_name': 'Македонски'},
+    {'code': 'ms', 'name': 'Malay', 'native_name': 'Bahasa Melayu'},
+    {'code': 'ml', 'name': 'Malayalam', 'native_name': 'മലയാളം'},
+    {'code': 'mt', 'name': 'Maltese', 'native_name': 'Malti'},
+    {'code': 'mr', 'name': 'Marathi', 'native_name': 'मराठी'},
+    {'code': 'mn', 'name': 'Mongolian', 'native_name': 'Монгол'},
+    {'code': 'ne', 'name': 'Nepali', 'native_name': 'नेपाली'},
+    {'code': 'nb', 'name': 'Norwegian', 'native_name': 'Norsk bokmål'},
+    {'code': 'fa', 'name': 'Persian', 'native_name': 'فارسی'},
+    {'code': 'pl', 'name': 'Polish', 'native_name': 'Polski'},
+    {'code': 'pt', 'name': 'Portuguese', 'native_name': 'Português'},
+    {'code': 'pt-BR', 'name': 'Portuguese (Brazil)', 'native_name': 'Português (Brasil)'},
+    {'code': 'pt-PT', 'name': 'Portuguese (Portugal)', 'native_name': 'Português (Portugal)'},
+    {'code': 'pa', 'name': 'Punjabi', 'native_name': 'ਪੰਜਾਬੀ'},
+    {'code': 'ro', 'name': 'Romanian', 'native_name': 'Română'},
+    {'code': 'ru', 'name': 'Russian', 'native_name': 'Русский'},
+    {'code': 'sr', 'name': 'Serbian', 'native_name': 'Српски'},
+    {'code': 'si', 'name': 'Sinhala', 'native_name': 'සිංහල'},
+    {'code': 'sk', 'name': 'Slovak', 'native_name': 'Slovenčina'},
+    {'code': 'sl', 'name': 'Slovenian', 'native_name': 'Slovenščina'},
+    {'code': 'es', 'name': 'Spanish', 'native_name': 'Español'},
+    {'code': 'sw', 'name': 'Swahili', 'native_name': 'Kiswahili'},
+    {'code': 'sv', 'name': 'Swedish', 'native_name': 'Svenska'},
+    {'code': 'tl', 'name': 'Tagalog', 'native_name': 'Tagalog'},
+    {'code': 'ta', 'name': 'Tamil', 'native_name': 'தமிழ்'},
+    {'code': 'te', 'name': 'Telugu', 'native_name': 'తెలుగు'},
+    {'code': 'th', 'name': 'Thai', 'native_name': 'ไทย'},
+    {'code': 'tr', 'name': 'Turkish', 'native_name': 'Türkçe'},
+    {'code': 'uk', 'name': 'Ukrainian', 'native_name': 'Українська'},
+    {'code': 'ur', 'name': 'Urdu', 'native_name': 'اردو'},
+    {'code': 'uz', 'name': 'Uzbek', 'native_name': 'Oʻzbekcha'},
+    {'code': 'vi', 'name': 'Vietnamese', 'native_name': 'Tiếng Việt'},
+    {'code': 'cy', 'name': 'Welsh', 'native_name': 'Cymraeg'},
+    {'code': 'yi', 'name': 'Yiddish', 'native_name': 'ייִדיש'},
+    {'code': 'zu', 'name': 'Zulu', 'native_name': 'isiZulu'},
+)
@@ -0,0 +1,73 @@
+"""
+Tests for chunk_text: streamed input must chunk exactly like the whole string.
+
+Run from the repository root with:  python -m unittest discover tests
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+import translator
+
+
+ALPHABET = 'ab .!?\n  \t' + '\u00e9'
+
+
+def random_text(rng: random.Random, length: int) -> str:
+    return ''.join(rng.choice(ALPHABET) for _ in range(length))
+
+
+def random_split(rng: random.Random, text: str):
+    cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, 8))))
+    return [text[start:end] for start, end in zip([0] + cuts, cuts + [len(text)])]
+
+
+class ChunkTextStreamingTest(unittest.TestCase):
+
+    def test_streamed_parts_match_whole_string(self):
+        rng = random.Random(20240601)
+        for _ in range(5000):
+            text = random_text(rng, rng.randint(0, 80))
+            chunk_size = rng.randint(1, 20)
+            parts = random_split(rng, text)
+            expected = list(translator.chunk_text(text, chunk_size))
+            with self.subTest(text=text, parts=parts, chunk_size=chunk_size):
+                self.assertEqual(list(translator.chunk_text(iter(parts), chunk_size)),
+                                 expected)
+
+    def test_chunks_cover_text_within_size(self):
+        rng = random.Random(7)
+        for _ in range(2000):
+            text = random_text(rng, rng.randint(0, 200))
+            chunk_size = rng.randint(1, 30)
+            chunks = list(translator.chunk_text(random_split(rng, text), chunk_size))
+            with self.subTest(text=text, chunk_size=chunk_size):
+                self.assertEqual(''.join(chunks), text)
+                self.assertTrue(all(0 < len(chunk) <= chunk_size for chunk in chunks))
+
+
+class ReadFileStreamingTest(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, 'wb') as f:
+            f.write('\ufeffone\r\ntwo\rthree \u00e9\n'.encode('utf-8'))
+        self.addCleanup(os.remove, self.path)
+
+    def test_matches_text_mode_read(self):
+        with translator.read_file_content(self.path, streaming=True) as blocks:
+            streamed = ''.join(blocks)
+        self.assertEqual(streamed, translator.read_file_content(self.path))
+
+    def test_close_before_iterating_releases_fd(self):
+        blocks = translator.read_file_content(self.path, streaming=True)
+        fd = blocks._fd
+        blocks.close()
+        with self.assertRaises(OSError):
+            os.fstat(fd)
+
+
+if __name__ == '__main__':
+    unittest.main()
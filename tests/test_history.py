@@ -0,0 +1,88 @@
+"""
+Tests for the SQLite translation history: trimming, filtering, permissions.
+
+Run from the repository root with:  python -m unittest discover tests
+"""
+
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+import translator
+
+
+def record(number: int, source: str = 'en', target: str = 'fr') -> dict:
+    return {
+        'source_text': f'text {number}',
+        'translated_text': f'texte {number}',
+        'source_lang': source,
+        'target_lang': target,
+        'timestamp': f'2024-01-01T00:00:{number:02d}+00:00',
+    }
+
+
+class HistoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        config_dir = os.path.join(self.dir, '.cli-translator')
+        self.history_file = os.path.join(config_dir, 'history.db')
+        for name, value in (('CONFIG_DIR', config_dir),
+                            ('HISTORY_FILE', self.history_file),
+                            ('_history_db', None)):
+            patcher = mock.patch.object(translator, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.close_db)
+
+    def close_db(self):
+        if translator._history_db is not None:
+            translator._history_db.close()
+
+    def save(self, *records, max_history: int = 100):
+        config = dict(translator.DEFAULT_CONFIG, history_enabled=True,
+                      max_history=max_history)
+        for rec in records:
+            self.assertTrue(translator.save_to_history(rec, config))
+
+    def test_reading_missing_history_creates_nothing(self):
+        self.assertEqual(translator.get_history(), [])
+        self.assertFalse(os.path.exists(os.path.dirname(self.history_file)))
+
+    @unittest.skipIf(os.name != 'posix', 'POSIX permissions')
+    def test_database_files_are_private(self):
+        self.save(record(1))
+        directory = os.path.dirname(self.history_file)
+        for name in os.listdir(directory):
+            with self.subTest(name=name):
+                mode = stat.S_IMODE(os.stat(os.path.join(directory, name)).st_mode)
+                self.assertEqual(mode, 0o600)
+
+    def test_max_history_keeps_newest_rows(self):
+        self.save(*(record(n) for n in range(1, 8)), max_history=3)
+        texts = [rec['source_text'] for rec in translator.get_history()]
+        self.assertEqual(texts, ['text 7', 'text 6', 'text 5'])
+
+    def test_zero_max_history_is_unlimited(self):
+        self.save(*(record(n) for n in range(1, 8)), max_history=0)
+        self.assertEqual(len(translator.get_history()), 7)
+
+    def test_filter_matches_either_side_newest_first(self):
+        self.save(record(1, 'en', 'fr'), record(2, 'de', 'es'), record(3, 'fr', 'en'),
+                  record(4, 'en', 'de'), record(5, 'en', 'fr'), record(6, 'fr', 'it'))
+        texts = [rec['source_text'] for rec in translator.get_history(filter_lang='fr')]
+        self.assertEqual(texts, ['text 6', 'text 5', 'text 3', 'text 1'])
+        texts = [rec['source_text'] for rec in translator.get_history(2, filter_lang='fr')]
+        self.assertEqual(texts, ['text 6', 'text 5'])
+
+    def test_filter_keeps_identical_records(self):
+        self.save(record(1), record(1))
+        self.assertEqual(len(translator.get_history(filter_lang='fr')), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
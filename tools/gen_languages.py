@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Generate _languages.py from tools/languages.json.
+
+The supported-languages table is static, so instead of parsing JSON on every
+CLI start it is compiled into a plain Python module of literals. Python
+caches the compiled module as a .pyc, so importing it costs almost nothing.
+
+Usage:
+    python tools/gen_languages.py
+
+Re-run after editing tools/languages.json and commit both files.
+"""
+
+import json
+import os
+from typing import Dict, List
+
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_FILE = os.path.join(TOOLS_DIR, 'languages.json')
+OUTPUT_FILE = os.path.join(os.path.dirname(TOOLS_DIR), '_languages.py')
+
+HEADER = '''"""
+Supported languages table.
+
+GENERATED by tools/gen_languages.py from tools/languages.json -- do not edit.
+"""
+
+from typing import Dict, FrozenSet, Tuple
+
+'''
+
+
+def load_languages(path: str = SOURCE_FILE) -> List[Dict]:
+    """
+    Read and validate the language source table.
+
+    Inputs:
+        path (str): Path to the JSON source table
+
+    Outputs:
+        list of dict: Entries with 'code', 'name' and 'native_name', sorted
+        alphabetically by English name
+
+    Raises:
+        ValueError: If an entry is missing a field or a code is duplicated
+    """
+    with open(path, encoding='utf-8') as f:
+        languages = json.load(f)
+
+    seen = set()
+    for entry in languages:
+        if not all(entry.get(k) for k in ('code', 'name', 'native_name')):
+            raise ValueError(f"Incomplete language entry: {entry!r}")
+        code = entry['code'].lower()
+        if code in seen:
+            raise ValueError(f"Duplicate language code: {entry['code']}")
+        seen.add(code)
+
+    return sorted(languages, key=lambda entry: entry['name'])
+
+
+def render(languages: List[Dict]) -> str:
+    """
+    Render the generated module source.
+
+    Inputs:
+        languages (list of dict): Output of load_languages()
+
+    Outputs:
+        str: Python source defining LANG_NAMES, NATIVE_NAMES, VALID_CODES
+        and SUPPORTED_LANGUAGES. Lookup tables are keyed by lower-cased code.
+    """
+    lines = [HEADER]
+
+    lines.append('LANG_NAMES: Dict[str, str] = {')
+    for entry in languages:
+        lines.append(f"    {entry['code'].lower()!r}: {entry['name']!r},")
+    lines.append('}\n')
+
+    lines.append('NATIVE_NAMES: Dict[str, str] = {')
+    for entry in languages:
+        lines.append(f"    {entry['code'].lower()!r}: {entry['native_name']!r},")
+    lines.append('}\n')
+
+    lines.append('VALID_CODES: FrozenSet[str] = frozenset({')
+    for entry in sorted(languages, key=lambda entry: entry['code'].lower()):
+        lines.append(f"    {entry['code'].lower()!r},")
+    lines.append('})\n')
+
+    lines.append('# Sorted by English name')
+    lines.append('SUPPORTED_LANGUAGES: Tuple[Dict[str, str], ...] = (')
+    for entry in languages:
+        lines.append(f"    {{'code': {entry['code']!r}, 'name': {entry['name']!r}, "
+                     f"'native_name': {entry['native_name']!r}}},")
+    lines.append(')')
+
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    source = render(load_languages())
+    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+        f.write(source)
+    print(f"Wrote {os.path.relpath(OUTPUT_FILE)}")
+
+
+if __name__ == '__main__':
+    main()
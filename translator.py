@@ -10,11 +10,168 @@ Author: CLI Translator Project
 License: MIT
 """
 
+from __future__ import annotations
+
+# Only modules needed on every invocation are imported here; everything else
+# (json, requests, datetime, ...) is imported inside the function that uses
+# it, so paths like --help and --version stay fast. os is always preloaded
+# by the interpreter and argparse already pulls in functools and re, so
+# importing them here costs nothing. typing is only needed by type checkers:
+# annotations are never evaluated at runtime.
 import argparse
+import functools
+import re
 import sys
 import os
-import json
-from typing import Optional, Dict, List, Tuple
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Iterable, Iterator, List, Tuple, Union
+
+
+__version__ = '0.1.0'
+
+CONFIG_DIR = os.path.join(os.path.expanduser('~'), '.cli-translator')
+CONFIG_FILE = os.path.join(CONFIG_DIR, 'config.json')
+HISTORY_FILE = os.path.join(CONFIG_DIR, 'history.db')
+PROMPT_HISTORY_FILE = os.path.join(CONFIG_DIR, 'prompt_history')
+CACHE_DIR = os.path.join(CONFIG_DIR, 'cache')
+
+# Provider language lists are refetched (or revalidated by ETag) once a week
+_LANGUAGES_CACHE_TTL = 7 * 24 * 60 * 60
+
+TRANSLATE_ENDPOINTS = {
+    'google': 'https://translation.googleapis.com/language/translate/v2',
+    'deepl': 'https://api-free.deepl.com/v2/translate',
+    'azure': 'https://api.cognitive.microsofttranslator.com/translate',
+    'libretranslate': 'https://libretranslate.com/translate',
+}
+
+LANGUAGES_ENDPOINTS = {
+    'google': 'https://translation.googleapis.com/language/translate/v2/languages',
+    'deepl': 'https://api-free.deepl.com/v2/languages',
+    'azure': 'https://api.cognitive.microsofttranslator.com/languages',
+    'libretranslate': 'https://libretranslate.com/languages',
+}
+
+_HISTORY_COLUMNS = ('timestamp', 'source_lang', 'target_lang',
+                    'source_text', 'translated_text')
+# Bumped whenever _init_history_db learns a new migration step
+_HISTORY_SCHEMA_VERSION = 2
+
+API_PROVIDERS = ('google', 'deepl', 'azure', 'libretranslate')
+
+# Most segments and characters each provider accepts in one translate request
+_BATCH_LIMITS = {
+    'google': (128, 30000),
+    'deepl': (50, 120000),
+    'azure': (1000, 50000),
+    'libretranslate': (50, 20000),
+}
+
+# Providers whose limit is on the request body (DeepL: 128 KiB) rather than
+# on characters; their budget above counts JSON-encoded bytes instead
+_BATCH_BODY_LIMITED = frozenset({'deepl'})
+
+# Concurrent requests (and pooled connections) used by translate_file
+_FILE_CONCURRENCY = 8
+
+DEFAULT_CONFIG = {
+    'api_key': '',
+    'default_source': 'auto',
+    'default_target': 'en',
+    'api_provider': 'google',
+    'history_enabled': True,
+    'max_history': 100,
+}
+
+
+def _parse_json(data: bytes):
+    """
+    Parse a JSON document, preferring simdjson, then orjson, when installed.
+    
+    Inputs:
+        data (bytes): Raw JSON document
+    
+    Outputs:
+        Parsed document. With simdjson this is a lazy proxy (Object/Array)
+        whose values are only decoded when accessed; otherwise plain
+        dicts/lists from orjson or the stdlib decoder.
+    
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    simdjson = _get_simdjson()
+    if simdjson is not None:
+        return simdjson.Parser().parse(data)
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+    return json.loads(data)
+
+
+def _dump_json(value, indent: bool = False) -> bytes:
+    """
+    Serialize a value to UTF-8 JSON, preferring orjson when it is installed.
+    
+    Inputs:
+        value: JSON-serializable value
+        indent (bool): Pretty-print with two-space indentation
+    
+    Outputs:
+        bytes: UTF-8 encoded JSON (non-ASCII kept as-is) ending in a newline
+    
+    Raises:
+        TypeError: If value is not JSON serializable
+    """
+    orjson = _get_orjson()
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, option=option)
+    import json
+    text = json.dumps(value, indent=2 if indent else None, ensure_ascii=False)
+    return text.encode('utf-8') + b'\n'
+
+
+def _materialize(value):
+    """Convert a (possibly lazy) parsed JSON object into a plain dict."""
+    simdjson = _get_simdjson()
+    if simdjson is not None and isinstance(value, simdjson.Object):
+        return value.as_dict()
+    return dict(value)
+
+
+_simdjson = None
+
+
+def _get_simdjson():
+    """Import the optional simdjson module on first use; None if missing."""
+    global _simdjson
+    if _simdjson is None:
+        try:
+            import simdjson
+            _simdjson = simdjson
+        except ImportError:
+            _simdjson = False
+    return _simdjson or None
+
+
+_orjson = None
+
+
+def _get_orjson():
+    """Import the optional orjson module on first use; None if missing."""
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            _orjson = False
+    return _orjson or None
 
 
 # ============================================================================
@@ -38,18 +195,42 @@ def load_config() -> Dict:
             - 'max_history': int, maximum number of history entries to keep
     
     Expected Behavior:
-        - Check if config file exists in ~/.cli-translator/config.json
-        - If it exists, read and parse the JSON file
-        - If it doesn't exist, return default configuration values
+        - Open ~/.cli-translator/config.json directly; a missing file
+          (FileNotFoundError) means default configuration values
         - Handle JSON parsing errors gracefully
-        - Create config directory if it doesn't exist
+        - Never creates the config directory; writers do that on demand
         - Validate configuration values
     
     Raises:
-        FileNotFoundError: If config directory cannot be created
         JSONDecodeError: If config file is corrupted
     """
-    pass
+    return _read_config()[0]
+
+
+def _read_config() -> Tuple[Dict, bool]:
+    """load_config(), plus whether config.json exists (False on first run)."""
+    config = dict(DEFAULT_CONFIG)
+    try:
+        with open(CONFIG_FILE, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        data = None
+    
+    if data is not None:
+        try:
+            config.update(_materialize(_parse_json(data)))
+        except (ValueError, TypeError) as e:
+            import json
+            raise json.JSONDecodeError(
+                f"Corrupted config file: {e}", data.decode('utf-8', 'replace'), 0)
+    
+    if config.get('api_provider') not in API_PROVIDERS:
+        config['api_provider'] = DEFAULT_CONFIG['api_provider']
+    if not isinstance(config.get('max_history'), int) or config['max_history'] < 0:
+        config['max_history'] = DEFAULT_CONFIG['max_history']
+    config['history_enabled'] = bool(config.get('history_enabled'))
+    
+    return config, data is not None
 
 
 def save_config(config: Dict) -> bool:
@@ -63,26 +244,110 @@ def save_config(config: Dict) -> bool:
         bool: True if save was successful, False otherwise
     
     Expected Behavior:
-        - Create config directory if it doesn't exist (~/.cli-translator/)
-        - Write configuration to config.json as formatted JSON
-        - Set appropriate file permissions (read/write for user only)
         - Validate configuration before saving
-        - Create backup of old config if it exists
+        - Write configuration as formatted JSON to a temp file created
+          with user-only permissions (0600); the config directory is only
+          created if that open fails with FileNotFoundError
+        - Keep the old config as config.json.bak if there was one, by
+          hard-linking it (copying where links are unsupported) so
+          config.json itself never disappears
+        - Rename the temp file over config.json in one atomic step
         - Handle write errors gracefully
     
     Raises:
         PermissionError: If cannot write to config directory
         ValueError: If config dictionary has invalid values
     """
-    pass
+    config = {**DEFAULT_CONFIG, **config}
+    if config['api_provider'] not in API_PROVIDERS:
+        raise ValueError(f"Unknown API provider: {config['api_provider']}")
+    if not isinstance(config['max_history'], int) or config['max_history'] < 0:
+        raise ValueError(f"Invalid max_history: {config['max_history']!r}")
+    if not validate_language_code(config['default_source'], config['api_provider']):
+        raise ValueError(f"Unsupported source language: {config['default_source']}")
+    if (config['default_target'].lower() == 'auto'
+            or not validate_language_code(config['default_target'], config['api_provider'])):
+        raise ValueError(f"Unsupported target language: {config['default_target']}")
+    config['history_enabled'] = bool(config['history_enabled'])
+    
+    data = _dump_json(config, indent=True)
+    tmp_path = f"{CONFIG_FILE}.{os.getpid()}.tmp"
+    try:
+        with _open_for_write(tmp_path, 'wb', opener=_private_opener) as f:
+            f.write(data)
+        _backup_config()
+        os.replace(tmp_path, CONFIG_FILE)
+    except PermissionError:
+        raise
+    except OSError:
+        return False
+    return True
+
+
+def _backup_config() -> None:
+    """Point config.json.bak at the current config.json, leaving it in place."""
+    backup = f"{CONFIG_FILE}.bak"
+    try:
+        os.unlink(backup)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(CONFIG_FILE, backup)
+        return
+    except FileNotFoundError:
+        return
+    except OSError:
+        pass
+    
+    # No hard links here (e.g. some network/FAT filesystems): copy instead
+    import shutil
+    try:
+        src = open(CONFIG_FILE, 'rb')
+    except FileNotFoundError:
+        return
+    with src, open(backup, 'wb', opener=_private_opener) as dst:
+        shutil.copyfileobj(src, dst)
+
+
+def _private_opener(path: str, flags: int) -> int:
+    """open() opener that creates files readable/writable by the user only."""
+    return os.open(path, flags, 0o600)
+
+
+def _open_for_write(path: str, mode: str = 'w', **kwargs):
+    """
+    Open a file for writing, creating its parent directory only if needed.
+    
+    Inputs:
+        path (str): File to open
+        mode (str): Writable open() mode
+        **kwargs: Passed through to open()
+    
+    Outputs:
+        file object: The opened file
+    
+    Expected Behavior:
+        - Try open() first, so the common case costs a single syscall
+        - On FileNotFoundError create the missing directories and retry
+    
+    Raises:
+        OSError: If the directory or file cannot be created
+    """
+    try:
+        return open(path, mode, **kwargs)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        return open(path, mode, **kwargs)
 
 
-def get_api_key(api_provider: str = 'google') -> Optional[str]:
+def get_api_key(api_provider: str = 'google', config: Optional[Dict] = None) -> Optional[str]:
     """
     Retrieve API key for the specified translation provider.
     
     Inputs:
         api_provider (str): Name of the API provider ('google', 'deepl', 'azure', 'libretranslate')
+        config (dict, optional): Settings already loaded by the caller;
+            the config file is only read when this is omitted
     
     Outputs:
         str or None: The API key if found, None if not configured
@@ -97,7 +362,18 @@ def get_api_key(api_provider: str = 'google') -> Optional[str]:
     Raises:
         None (returns None for missing keys)
     """
-    pass
+    for var in (f"TRANSLATOR_{api_provider.upper()}_API_KEY", 'TRANSLATOR_API_KEY'):
+        if os.environ.get(var):
+            return os.environ[var]
+    
+    if config is None:
+        try:
+            config = load_config()
+        except ValueError:
+            return None
+    if config.get('api_provider') == api_provider and config.get('api_key'):
+        return config['api_key']
+    return None
 
 
 def setup_first_run() -> Dict:
@@ -125,7 +401,63 @@ def setup_first_run() -> Dict:
     Raises:
         KeyboardInterrupt: If user cancels setup (handle gracefully)
     """
-    pass
+    from getpass import getpass
+    
+    # Re-running --config starts from the current settings; prompts go
+    # through plain input() so nothing typed here lands in prompt history.
+    try:
+        current = load_config()
+    except ValueError:
+        # A corrupt file is exactly what --config is used to repair
+        current = dict(DEFAULT_CONFIG)
+    print("Welcome to cli-translator! Let's set up your configuration.")
+    print(f"Settings are saved to {CONFIG_FILE}. Press Enter to keep the value in brackets.\n")
+    try:
+        print(f"Translation providers: {', '.join(API_PROVIDERS)}")
+        while True:
+            provider = input(f"API provider [{current['api_provider']}]: ").strip().lower()
+            provider = provider or current['api_provider']
+            if provider in API_PROVIDERS:
+                break
+            print(f"Unknown provider '{provider}'.")
+        
+        keep_key = current['api_key'] if provider == current['api_provider'] else ''
+        api_key = getpass(f"API key{' [keep current]' if keep_key else ''}: ").strip() or keep_key
+        
+        while True:
+            source = input(f"Default source language [{current['default_source']}]: ").strip()
+            source = source or current['default_source']
+            if validate_language_code(source, provider):
+                break
+            print(f"Unsupported language code '{source}'. Use --list-languages to see them.")
+        
+        while True:
+            target = input(f"Default target language [{current['default_target']}]: ").strip()
+            target = target or current['default_target']
+            if target.lower() != 'auto' and validate_language_code(target, provider):
+                break
+            print(f"Unsupported target language '{target}'.")
+        
+        default = 'Y/n' if current['history_enabled'] else 'y/N'
+        answer = input(f"Save translation history? [{default}]: ").strip().lower()
+        history_enabled = answer.startswith('y') if answer else current['history_enabled']
+    except (KeyboardInterrupt, EOFError):
+        print("\nSetup cancelled; configuration unchanged.")
+        raise KeyboardInterrupt
+    
+    config = {**current, 'api_provider': provider, 'api_key': api_key,
+              'default_source': source, 'default_target': target,
+              'history_enabled': history_enabled}
+    if not save_config(config):
+        raise OSError(f"Could not write {CONFIG_FILE}")
+    
+    print("\nConfiguration saved:")
+    print(f"  Provider:  {provider}")
+    print(f"  API key:   {'set' if api_key else 'not set (use TRANSLATOR_API_KEY)'}")
+    print(f"  Languages: {source} -> {target}")
+    print(f"  History:   {'on' if history_enabled else 'off'}")
+    print("\nTry: translator.py \"Hello world\" -t es   or   translator.py -i")
+    return config
 
 
 # ============================================================================
@@ -133,7 +465,7 @@ def setup_first_run() -> Dict:
 # ============================================================================
 
 def translate_text(text: str, source_lang: str = 'auto', target_lang: str = 'en', 
-                   api_provider: str = 'google') -> Dict:
+                   api_provider: str = 'google', config: Optional[Dict] = None) -> Dict:
     """
     Translate text from source language to target language.
     
@@ -142,6 +474,9 @@ def translate_text(text: str, source_lang: str = 'auto', target_lang: str = 'en'
         source_lang (str): Source language code (e.g., 'en', 'es', 'fr', 'auto' for auto-detect)
         target_lang (str): Target language code (e.g., 'en', 'es', 'fr')
         api_provider (str): Translation API to use ('google', 'deepl', 'azure', 'libretranslate')
+        config (dict, optional): Settings from load_config(); callers that
+            translate repeatedly pass it so the config file is not re-read
+            for the API key and history settings on every call
     
     Outputs:
         dict: Translation result containing:
@@ -168,7 +503,57 @@ def translate_text(text: str, source_lang: str = 'auto', target_lang: str = 'en'
         AuthenticationError: If API key is invalid
         RateLimitError: If API rate limit exceeded
     """
-    pass
+    from datetime import datetime, timezone
+    
+    if not validate_text_length(text):
+        raise ValueError("Text must be between 1 and 5000 characters")
+    if api_provider not in API_PROVIDERS:
+        raise ValueError(f"Unknown API provider: {api_provider}")
+    if not validate_language_code(source_lang, api_provider):
+        raise ValueError(f"Unsupported source language: {source_lang}")
+    if target_lang.lower() == 'auto' or not validate_language_code(target_lang, api_provider):
+        raise ValueError(f"Unsupported target language: {target_lang}")
+    if config is None:
+        try:
+            config = load_config()
+        except ValueError:
+            config = dict(DEFAULT_CONFIG)
+    
+    # Every supported provider detects the source language itself, so
+    # 'auto' is passed through rather than spending a request on detection
+    response = call_translation_api(text, source_lang, target_lang, api_provider,
+                                    _require_api_key(api_provider, config))
+    detected, confidence = _detected_language(response, api_provider)
+    
+    result = {
+        'translated_text': parse_api_response(response, api_provider),
+        'source_language': detected or source_lang,
+        'target_language': target_lang,
+        'confidence': confidence,
+        'api_provider': api_provider,
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+    }
+    try:
+        save_to_history({
+            'source_text': text,
+            'translated_text': result['translated_text'],
+            'source_lang': result['source_language'],
+            'target_lang': target_lang,
+            'timestamp': result['timestamp'],
+        }, config)
+    except OSError:
+        pass
+    return result
+
+
+def _require_api_key(api_provider: str, config: Optional[Dict] = None) -> str:
+    """Return the provider's API key; only LibreTranslate may run without one."""
+    api_key = get_api_key(api_provider, config)
+    if not api_key and api_provider != 'libretranslate':
+        raise AuthenticationError(
+            f"No API key configured for {api_provider}. Run with --config "
+            f"or set TRANSLATOR_API_KEY.")
+    return api_key or ''
 
 
 def call_translation_api(text: str, source_lang: str, target_lang: str, 
@@ -189,7 +574,9 @@ def call_translation_api(text: str, source_lang: str, target_lang: str,
     Expected Behavior:
         - Build appropriate API request URL for the provider
         - Set correct headers (API key, content-type, etc.)
-        - Make POST or GET request as required by API
+        - Make POST or GET request as required by API, over the shared
+          keep-alive session so repeat calls skip the TCP/TLS handshake
+        - Retry transient failures (429, 5xx) with backoff
         - Set appropriate timeout (e.g., 10 seconds)
         - Handle different API endpoint formats:
             - Google: https://translation.googleapis.com/language/translate/v2
@@ -203,8 +590,136 @@ def call_translation_api(text: str, source_lang: str, target_lang: str,
         requests.exceptions.RequestException: For network errors
         requests.exceptions.HTTPError: For HTTP errors (4xx, 5xx)
         requests.exceptions.Timeout: For timeout errors
+        AuthenticationError: If the API rejects the key (401/403)
+        RateLimitError: If the API reports rate limiting (429)
     """
-    pass
+    url, kwargs = _build_translate_request([text], source_lang, target_lang,
+                                           api_provider, api_key)
+    return _check_response(_get_session().post(url, timeout=10, **kwargs))
+
+
+_session = None
+
+
+def _get_session():
+    """
+    Return the process-wide HTTP session, creating it on first use.
+    
+    Inputs:
+        None
+    
+    Outputs:
+        requests.Session: Session whose https adapter pools up to
+        _FILE_CONCURRENCY keep-alive connections per host and retries
+        429/5xx responses and connection errors (3 tries, 0.2s backoff)
+    
+    Raises:
+        ImportError: If requests is not installed
+    """
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        # Translation requests are idempotent, so POSTs are retried too;
+        # the final 429/5xx response is returned for _check_response
+        retries = Retry(total=3, backoff_factor=0.2,
+                        status_forcelist=(429, 500, 502, 503, 504),
+                        allowed_methods=frozenset({'GET', 'HEAD', 'POST'}),
+                        raise_on_status=False)
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=4,
+                                              pool_maxsize=_FILE_CONCURRENCY,
+                                              max_retries=retries))
+        _session = session
+    return _session
+
+
+def _prewarm_session(api_provider: str) -> None:
+    """Open a connection to the provider in the background, ignoring failures."""
+    import threading
+    
+    try:
+        session = _get_session()
+    except ImportError:
+        return
+    
+    def warm():
+        try:
+            session.head(TRANSLATE_ENDPOINTS[api_provider], timeout=5)
+        except Exception:
+            pass
+    
+    threading.Thread(target=warm, daemon=True).start()
+
+
+def _build_translate_request(segments: List[str], source_lang: str, target_lang: str,
+                             api_provider: str, api_key: str) -> Tuple[str, Dict]:
+    """
+    Build the URL and requests keyword arguments for a translate call.
+    
+    Inputs:
+        segments (list of str): Texts to translate in one request, within
+            the provider's _BATCH_LIMITS
+        source_lang (str): Source language code or 'auto'
+        target_lang (str): Target language code
+        api_provider (str): Which API to call
+        api_key (str): API authentication key ('' if none)
+    
+    Outputs:
+        tuple: (url, kwargs) where kwargs holds 'params', 'headers' and
+        'json' for requests.post / Session.post
+    
+    Raises:
+        ValueError: If api_provider is unknown
+    """
+    auto = source_lang.lower() == 'auto'
+    params = {}
+    headers = {}
+    if api_provider == 'google':
+        params['key'] = api_key
+        body = {'q': segments, 'target': target_lang, 'format': 'text'}
+        if not auto:
+            body['source'] = source_lang
+    elif api_provider == 'deepl':
+        headers['Authorization'] = f"DeepL-Auth-Key {api_key}"
+        body = {'text': segments, 'target_lang': target_lang.upper()}
+        if not auto:
+            body['source_lang'] = source_lang.upper()
+    elif api_provider == 'azure':
+        headers['Ocp-Apim-Subscription-Key'] = api_key
+        params = {'api-version': '3.0', 'to': target_lang}
+        if not auto:
+            params['from'] = source_lang
+        body = [{'Text': segment} for segment in segments]
+    elif api_provider == 'libretranslate':
+        body = {'q': segments, 'source': source_lang, 'target': target_lang,
+                'format': 'text'}
+        if api_key:
+            body['api_key'] = api_key
+    else:
+        raise ValueError(f"Unknown API provider: {api_provider}")
+    return TRANSLATE_ENDPOINTS[api_provider], {
+        'params': params, 'headers': headers, 'json': body}
+
+
+def _check_response(response) -> Dict:
+    """Map auth/rate-limit statuses to our exceptions, then return the JSON body."""
+    if response.status_code in (401, 403):
+        raise AuthenticationError(f"API rejected the key (HTTP {response.status_code})")
+    if response.status_code == 429:
+        raise RateLimitError("API rate limit exceeded, try again later")
+    response.raise_for_status()
+    return response.json()
+
+
+def _detected_language(response, api_provider: str) -> Tuple[Optional[str], Optional[float]]:
+    """Pull the detected source language and confidence out of a response."""
+    try:
+        return _DETECTORS[api_provider](response)
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return None, None
 
 
 def parse_api_response(response: Dict, api_provider: str) -> str:
@@ -224,15 +739,96 @@ def parse_api_response(response: Dict, api_provider: str) -> str:
             - DeepL: response['translations'][0]['text']
             - Azure: response[0]['translations'][0]['text']
             - LibreTranslate: response['translatedText']
+        - Dispatch to the provider's specialized parser in _PARSERS
         - Validate that expected fields exist
         - Return cleaned/stripped text
-        - Handle HTML entities if present
+        - Decode HTML entities, only when the text contains '&'
     
     Raises:
         KeyError: If expected field is missing in response
         ValueError: If response format is unexpected
     """
-    pass
+    try:
+        parser = _PARSERS[api_provider]
+    except KeyError:
+        raise ValueError(f"Unknown API provider: {api_provider}")
+    try:
+        return parser(response)[0]
+    except (IndexError, TypeError) as e:
+        raise ValueError(f"Unexpected {api_provider} response format: {e}")
+
+
+# Per-provider parsers: each takes a raw (possibly batched) response and
+# returns every translated segment in request order, cleaned by
+# _clean_translation. Callers translating many chunks look one up once and
+# call it directly.
+
+def _clean_translation(text: str) -> str:
+    """Strip a translation, decoding HTML entities only when it has any."""
+    if '&' in text:
+        import html
+        text = html.unescape(text)
+    return text.strip()
+
+
+def _parse_google(response) -> List[str]:
+    return [_clean_translation(t['translatedText'])
+            for t in response['data']['translations']]
+
+
+def _parse_deepl(response) -> List[str]:
+    return [_clean_translation(t['text']) for t in response['translations']]
+
+
+def _parse_azure(response) -> List[str]:
+    return [_clean_translation(item['translations'][0]['text']) for item in response]
+
+
+def _parse_libretranslate(response) -> List[str]:
+    texts = response['translatedText']
+    if isinstance(texts, str):
+        return [_clean_translation(texts)]
+    return [_clean_translation(text) for text in texts]
+
+
+_PARSERS = {
+    'google': _parse_google,
+    'deepl': _parse_deepl,
+    'azure': _parse_azure,
+    'libretranslate': _parse_libretranslate,
+}
+
+
+# Per-provider detected-language extractors, returning (code, confidence)
+
+def _detect_google(response) -> Tuple[Optional[str], Optional[float]]:
+    return response['data']['translations'][0].get('detectedSourceLanguage'), None
+
+
+def _detect_deepl(response) -> Tuple[Optional[str], Optional[float]]:
+    detected = response['translations'][0].get('detected_source_language')
+    return (detected.lower() if detected else None), None
+
+
+def _detect_azure(response) -> Tuple[Optional[str], Optional[float]]:
+    detected = response[0].get('detectedLanguage') or {}
+    return detected.get('language'), detected.get('score')
+
+
+def _detect_libretranslate(response) -> Tuple[Optional[str], Optional[float]]:
+    detected = response.get('detectedLanguage') or {}
+    if isinstance(detected, list):
+        detected = detected[0] if detected else {}
+    confidence = detected.get('confidence')
+    return detected.get('language'), (confidence / 100 if confidence is not None else None)
+
+
+_DETECTORS = {
+    'google': _detect_google,
+    'deepl': _detect_deepl,
+    'azure': _detect_azure,
+    'libretranslate': _detect_libretranslate,
+}
 
 
 # ============================================================================
@@ -268,54 +864,194 @@ def detect_language(text: str, api_provider: str = 'google') -> Tuple[str, float
     pass
 
 
-def validate_language_code(lang_code: str) -> bool:
+@functools.lru_cache(maxsize=256)
+def validate_language_code(lang_code: str, api_provider: Optional[str] = None) -> bool:
     """
     Validate that a language code is supported.
     
     Inputs:
         lang_code (str): Language code to validate (e.g., 'en', 'es', 'zh-CN')
+        api_provider (str, optional): Also accept codes from this provider's
+            own language list (e.g. 'haw' for Google, 'zh-Hans' for Azure)
     
     Outputs:
         bool: True if language code is valid and supported, False otherwise
     
     Expected Behavior:
-        - Check against list of supported language codes
+        - Check against the generated VALID_CODES set (O(1) membership)
+        - Memoized, so repeat checks of the same code skip the table
+          import and any case folding
         - Support both 2-letter (ISO 639-1) and extended codes
-        - Handle case-insensitive matching
+        - Handle case-insensitive matching, trying the code as given
+          first since it is usually already lower case
         - Accept 'auto' as valid for source language
         - Support common variants (e.g., 'zh-CN', 'zh-TW', 'pt-BR')
+        - Codes outside the table are checked, case-insensitively, against
+          get_supported_languages(api_provider), so anything --list-languages
+          shows for the provider is accepted
     
     Raises:
         None (returns bool)
     """
-    pass
-
-
-def get_supported_languages(api_provider: str = 'google') -> List[Dict]:
+    from _languages import VALID_CODES
+    if lang_code in VALID_CODES:
+        return True
+    code = lang_code.lower()
+    if code in VALID_CODES or code == 'auto':
+        return True
+    if api_provider is None:
+        return False
+    return any(lang['code'].lower() == code
+               for lang in get_supported_languages(api_provider))
+
+
+@functools.lru_cache(maxsize=4)
+def get_supported_languages(api_provider: str = 'google',
+                            api_key: Optional[str] = None) -> Tuple[Dict, ...]:
     """
     Get list of all supported languages for the API provider.
     
     Inputs:
         api_provider (str): API provider to query
+        api_key (str, optional): Key for the provider, when the caller has
+            already resolved it; looked up with get_api_key() otherwise
     
     Outputs:
-        list of dict: Each dict contains:
+        tuple of dict: Each dict contains:
             - 'code': str, language code (e.g., 'en')
             - 'name': str, language name in English (e.g., 'English')
             - 'native_name': str, language name in native script (e.g., 'English')
     
     Expected Behavior:
-        - Query API for supported languages (if API supports this)
-        - Or return hard-coded list of common languages
-        - Sort alphabetically by English name
-        - Include language code, English name, and native name
-        - Cache results to avoid repeated API calls
-        - Handle API errors by returning common languages list
+        - Memoized in-process, so repeated calls in one session are free
+        - Otherwise return the provider's list from the disk cache
+          (~/.cli-translator/cache/langs-<provider>.pkl) while it is
+          less than a week old
+        - Once stale, query the provider API, sending the cached ETag so an
+          unchanged list costs a 304 and a touch of the cache file
+        - Fall back to the generated _languages.py table if the provider
+          cannot be queried (offline, no API key, unexpected response)
+        - Sorted alphabetically by English name
+        - The returned tuple is shared; callers must not mutate its entries
     
     Raises:
-        ConnectionError: If cannot fetch from API and no cache available
+        None (falls back to the built-in table)
     """
-    pass
+    import pickle
+    import time
+    
+    cache_path = os.path.join(CACHE_DIR, f"langs-{api_provider}.pkl")
+    cached = None
+    try:
+        with open(cache_path, 'rb') as f:
+            age = time.time() - os.fstat(f.fileno()).st_mtime
+            cached = pickle.load(f)
+        if age < _LANGUAGES_CACHE_TTL:
+            return cached['languages']
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError):
+        cached = None
+    
+    try:
+        etag = cached.get('etag') if cached else None
+        fetched = _fetch_supported_languages(api_provider, etag, api_key)
+    except Exception:
+        fetched = None
+    
+    if fetched is None:
+        if cached is not None:
+            return cached['languages']
+        from _languages import SUPPORTED_LANGUAGES
+        return SUPPORTED_LANGUAGES
+    
+    if fetched is _NOT_MODIFIED:
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return cached['languages']
+    
+    try:
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with _open_for_write(tmp_path, 'wb') as f:
+            pickle.dump(fetched, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return fetched['languages']
+
+
+# Sentinel returned by _fetch_supported_languages on HTTP 304
+_NOT_MODIFIED = object()
+
+
+def _fetch_supported_languages(api_provider: str, etag: Optional[str] = None,
+                               api_key: Optional[str] = None):
+    """
+    Query a provider's language-list endpoint.
+    
+    Inputs:
+        api_provider (str): Which API to query
+        etag (str, optional): ETag of the cached list, sent as If-None-Match
+        api_key (str, optional): Provider key; looked up when omitted
+    
+    Outputs:
+        dict with 'etag' (str or None) and 'languages' (tuple of dict, same
+        shape as get_supported_languages), _NOT_MODIFIED if the server
+        reports the cached list is current, or None if the provider needs
+        an API key and none is configured
+    
+    Raises:
+        ImportError: If requests is not installed
+        requests.exceptions.RequestException: For network/HTTP errors
+        KeyError, TypeError, ValueError: If the response format is unexpected
+    """
+    if api_key is None:
+        api_key = get_api_key(api_provider)
+    params = {}
+    headers = {}
+    if api_provider == 'google':
+        if not api_key:
+            return None
+        params = {'key': api_key, 'target': 'en'}
+    elif api_provider == 'deepl':
+        if not api_key:
+            return None
+        params = {'type': 'target'}
+        headers['Authorization'] = f"DeepL-Auth-Key {api_key}"
+    elif api_provider == 'azure':
+        params = {'api-version': '3.0', 'scope': 'translation'}
+    elif api_provider != 'libretranslate':
+        return None
+    if etag:
+        headers['If-None-Match'] = etag
+    
+    response = _get_session().get(LANGUAGES_ENDPOINTS[api_provider], params=params,
+                                  headers=headers, timeout=10)
+    if response.status_code == 304:
+        return _NOT_MODIFIED
+    response.raise_for_status()
+    data = response.json()
+    
+    if api_provider == 'google':
+        pairs = [(lang['language'], lang.get('name') or lang['language'], None)
+                 for lang in data['data']['languages']]
+    elif api_provider == 'deepl':
+        pairs = [(lang['language'].lower(), lang['name'], None) for lang in data]
+    elif api_provider == 'azure':
+        pairs = [(code, lang['name'], lang.get('nativeName'))
+                 for code, lang in data['translation'].items()]
+    else:
+        pairs = [(lang['code'], lang['name'], None) for lang in data]
+    
+    from _languages import NATIVE_NAMES
+    languages = tuple(sorted(
+        ({'code': code, 'name': name,
+          'native_name': native or NATIVE_NAMES.get(code.lower(), name)}
+         for code, name, native in pairs),
+        key=lambda lang: lang['name']))
+    if not languages:
+        raise ValueError(f"Empty language list from {api_provider}")
+    return {'etag': response.headers.get('ETag'), 'languages': languages}
 
 
 # ============================================================================
@@ -323,7 +1059,8 @@ def get_supported_languages(api_provider: str = 'google') -> List[Dict]:
 # ============================================================================
 
 def translate_file(input_file: str, output_file: str, source_lang: str = 'auto',
-                   target_lang: str = 'en', api_provider: str = 'google') -> Dict:
+                   target_lang: str = 'en', api_provider: str = 'google',
+                   config: Optional[Dict] = None) -> Dict:
     """
     Translate entire text file.
     
@@ -333,6 +1070,8 @@ def translate_file(input_file: str, output_file: str, source_lang: str = 'auto',
         source_lang (str): Source language code or 'auto'
         target_lang (str): Target language code
         api_provider (str): Translation API to use
+        config (dict, optional): Settings from load_config(), used for the
+            API key; the config file is read when omitted
     
     Outputs:
         dict: Summary of translation containing:
@@ -342,13 +1081,25 @@ def translate_file(input_file: str, output_file: str, source_lang: str = 'auto',
             - 'success': bool, whether translation completed successfully
     
     Expected Behavior:
-        - Check input file exists and is readable
-        - Read file content (handle large files by chunking)
+        - Stream file content in 1MB decoded blocks (open() reports a
+          missing/unreadable file)
         - Split into manageable chunks if file is large (e.g., 5000 chars each)
-        - Translate each chunk separately
-        - Preserve line breaks and basic formatting
-        - Write translated content to output file
-        - Show progress for large files
+        - Validate the language codes as translate_text does
+        - Pack chunks into batches within the provider's per-request
+          segment and character limits (_BATCH_LIMITS; DeepL's is on
+          encoded request bytes), so N chunks cost
+          about ceil(N / batch size) requests
+        - Run as a pipeline: batches are formed lazily from the chunker,
+          translated by up to _FILE_CONCURRENCY threads over the shared
+          keep-alive session, and written out in order as they complete,
+          so reading, translating and writing overlap
+        - Keep at most 2 * _FILE_CONCURRENCY batches in flight, so memory
+          stays bounded however large the file is
+        - Preserve line breaks and basic formatting: whitespace around each
+          chunk is kept locally rather than sent to the API
+        - Write to a temp file and rename it over output_file only once
+          everything has been translated
+        - Show progress on stderr when there is more than one batch
         - Handle encoding issues (assume UTF-8, detect if needed)
         - Create output directory if it doesn't exist
     
@@ -357,24 +1108,161 @@ def translate_file(input_file: str, output_file: str, source_lang: str = 'auto',
         PermissionError: If cannot read input or write output
         UnicodeDecodeError: If file encoding is incompatible
     """
-    pass
-
-
-def read_file_content(file_path: str, encoding: str = 'utf-8') -> str:
+    import time
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+    
+    started = time.perf_counter()
+    if api_provider not in API_PROVIDERS:
+        raise ValueError(f"Unknown API provider: {api_provider}")
+    if not validate_language_code(source_lang, api_provider):
+        raise ValueError(f"Unsupported source language: {source_lang}")
+    if target_lang.lower() == 'auto' or not validate_language_code(target_lang, api_provider):
+        raise ValueError(f"Unsupported target language: {target_lang}")
+    api_key = _require_api_key(api_provider, config)
+    parser = _PARSERS[api_provider]
+    session = _get_session()
+    
+    total_chars = 0
+    total_lines = 0
+    ends_with_newline = True
+    
+    def counted(blocks: Iterator[str]) -> Iterator[str]:
+        nonlocal total_chars, total_lines, ends_with_newline
+        for block in blocks:
+            total_chars += len(block)
+            total_lines += block.count('\n')
+            ends_with_newline = block.endswith('\n')
+            yield block
+    
+    def translate_batch(batch: List[Tuple[str, str, str]]) -> str:
+        segments = [core for _, core, _ in batch if core]
+        texts = iter(())
+        if segments:
+            url, kwargs = _build_translate_request(segments, source_lang, target_lang,
+                                                   api_provider, api_key)
+            response = _check_response(session.post(url, timeout=30, **kwargs))
+            translated = parser(response)
+            if len(translated) != len(segments):
+                raise ValueError(f"Expected {len(segments)} translations, "
+                                 f"got {len(translated)}")
+            texts = iter(translated)
+        return ''.join(lead + (next(texts) if core else '') + trail
+                       for lead, core, trail in batch)
+    
+    written = 0
+    tmp_path = f"{output_file}.{os.getpid()}.tmp"
+    pending = deque()
+    blocks = read_file_content(input_file, streaming=True)
+    try:
+        with _open_for_write(tmp_path, 'w', encoding='utf-8') as out, \
+                ThreadPoolExecutor(max_workers=_FILE_CONCURRENCY) as pool:
+            
+            def drain(keep: int) -> None:
+                nonlocal written
+                while len(pending) > keep:
+                    out.write(pending.popleft().result())
+                    written += 1
+                    if written > 1:
+                        sys.stderr.write(f"\rTranslated {written} batches")
+                        sys.stderr.flush()
+            
+            try:
+                for batch in _batch_chunks(chunk_text(counted(blocks)), api_provider):
+                    pending.append(pool.submit(translate_batch, batch))
+                    drain(2 * _FILE_CONCURRENCY - 1)
+                drain(0)
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    finally:
+        blocks.close()
+        if written > 1:
+            sys.stderr.write('\n')
+    
+    return {
+        'total_chars': total_chars,
+        'total_lines': total_lines + (0 if ends_with_newline else 1),
+        'time_taken': time.perf_counter() - started,
+        'success': True,
+    }
+
+
+def _batch_chunks(chunks: Iterator[str], api_provider: str) -> Iterator[List[Tuple[str, str, str]]]:
+    """
+    Group chunks into translate requests within the provider's limits.
+    
+    Inputs:
+        chunks (iterator of str): Output of chunk_text()
+        api_provider (str): Provider whose _BATCH_LIMITS apply
+    
+    Outputs:
+        iterator of list: Batches of (leading whitespace, text, trailing
+        whitespace) tuples; only the stripped text is sent to the API.
+        Whitespace-only chunks ride along with an empty text.
+    """
+    max_segments, max_chars = _BATCH_LIMITS[api_provider]
+    size = len
+    if api_provider in _BATCH_BODY_LIMITED:
+        import json
+        
+        # Size as sent: requests escapes non-ASCII text as \uXXXX, so CJK
+        # costs 6 bytes a character; +1 for the separating comma
+        def size(text: str) -> int:
+            return len(json.dumps(text)) + 1
+    batch = []
+    segments = 0
+    chars = 0
+    for chunk in chunks:
+        core = chunk.strip()
+        cost = size(core) if core else 0
+        if core and batch and (segments >= max_segments or chars + cost > max_chars):
+            yield batch
+            batch = []
+            segments = 0
+            chars = 0
+        lead = len(chunk) - len(chunk.lstrip())
+        batch.append((chunk[:lead], core, chunk[lead + len(core):]))
+        if core:
+            segments += 1
+            chars += cost
+    if batch:
+        yield batch
+
+
+def read_file_content(file_path: str, encoding: str = 'utf-8',
+                      streaming: bool = False) -> Union[str, Iterator[str]]:
     """
     Read content from a text file.
     
     Inputs:
         file_path (str): Path to file to read
         encoding (str): Text encoding to use (default 'utf-8')
+        streaming (bool): Return an iterable of decoded pieces instead of
+            one string
     
     Outputs:
-        str: File content as string
+        str: File content as string, or with streaming=True an iterable of
+        str pieces that concatenate to the same content; it holds the file
+        open until its close() is called (it is also a context manager)
     
     Expected Behavior:
-        - Check file exists
-        - Open file with specified encoding
-        - Read entire content
+        - Open file with specified encoding; no separate existence check,
+          open() raises FileNotFoundError itself
+        - Read entire content, or with streaming=True read 1MB at a time
+          with os.read and decode each block incrementally, so only about
+          one block is in memory and callers can start on the first block
+          before the rest is read
         - Close file properly
         - Strip BOM (byte order mark) if present
         - Handle different line endings (\\n, \\r\\n, \\r)
@@ -382,9 +1270,68 @@ def read_file_content(file_path: str, encoding: str = 'utf-8') -> str:
     Raises:
         FileNotFoundError: If file doesn't exist
         PermissionError: If file is not readable
-        UnicodeDecodeError: If encoding is wrong
+        UnicodeDecodeError: If encoding is wrong (while iterating, when
+            streaming)
     """
-    pass
+    if streaming:
+        # Opened here so a missing file is reported by this call, not by
+        # the first iteration
+        return _StreamedFile(os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0)),
+                             encoding)
+    
+    # Universal newlines mode turns \r\n and \r into \n
+    with open(file_path, 'r', encoding=encoding) as f:
+        content = f.read()
+    if content.startswith('\ufeff'):
+        content = content[1:]
+    return content
+
+
+_READ_BLOCK_SIZE = 1 << 20
+
+
+class _StreamedFile:
+    """Decoded text blocks of an open file descriptor; close() releases it."""
+    
+    def __init__(self, fd: int, encoding: str):
+        self._fd = fd
+        self._blocks = _read_decoded(fd, encoding)
+    
+    def __iter__(self) -> Iterator[str]:
+        return self._blocks
+    
+    def close(self) -> None:
+        self._blocks.close()
+        if self._fd is not None:
+            fd, self._fd = self._fd, None
+            os.close(fd)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _read_decoded(fd: int, encoding: str) -> Iterator[str]:
+    """Decode a file descriptor block by block, like text-mode read()."""
+    import codecs
+    import io
+    
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(encoding)(), translate=True)
+    at_start = True
+    while True:
+        block = os.read(fd, _READ_BLOCK_SIZE)
+        text = decoder.decode(block, final=not block)
+        if at_start and text:
+            at_start = False
+            if text.startswith('\ufeff'):
+                text = text[1:]
+        if text:
+            yield text
+        if not block:
+            return
 
 
 def write_file_content(file_path: str, content: str, encoding: str = 'utf-8') -> bool:
@@ -400,8 +1347,8 @@ def write_file_content(file_path: str, content: str, encoding: str = 'utf-8') ->
         bool: True if write successful, False otherwise
     
     Expected Behavior:
-        - Create directory path if it doesn't exist
-        - Open file for writing (overwrite if exists)
+        - Open file for writing (overwrite if exists), creating the
+          directory path only if the open fails with FileNotFoundError
         - Write content with specified encoding
         - Use platform-appropriate line endings
         - Close file properly
@@ -411,14 +1358,19 @@ def write_file_content(file_path: str, content: str, encoding: str = 'utf-8') ->
         PermissionError: If cannot write to location
         OSError: If disk is full or other OS error
     """
-    pass
+    # Text mode translates \n into os.linesep on write
+    with _open_for_write(file_path, 'w', encoding=encoding) as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    return True
 
 
 # ============================================================================
 # HISTORY MANAGEMENT
 # ============================================================================
 
-def save_to_history(translation_record: Dict) -> bool:
+def save_to_history(translation_record: Dict, config: Optional[Dict] = None) -> bool:
     """
     Save a translation to history.
     
@@ -429,22 +1381,120 @@ def save_to_history(translation_record: Dict) -> bool:
             - 'source_lang': str
             - 'target_lang': str
             - 'timestamp': str
+        config (dict, optional): Settings already loaded by the caller;
+            the config file is only read when this is omitted
     
     Outputs:
         bool: True if saved successfully, False otherwise
     
     Expected Behavior:
         - Check if history is enabled in config
-        - Load existing history from file/database
-        - Append new record with timestamp
-        - Limit history size (remove oldest if over limit)
-        - Save updated history
-        - Handle concurrent access (file locking if needed)
+        - Insert the record, with a timestamp, as one row of the SQLite
+          history database (history.db)
+        - Limit history size to max_history (0 means unlimited) by deleting
+          everything older than the newest max_history rows; a rowid range
+          delete, so it stays cheap however large the table is
+        - SQLite's WAL journal keeps concurrent writers and readers safe
     
     Raises:
-        PermissionError: If cannot write to history file
+        None (returns False on database errors)
     """
-    pass
+    import sqlite3
+    from datetime import datetime, timezone
+    
+    if config is None:
+        try:
+            config = load_config()
+        except ValueError:
+            config = dict(DEFAULT_CONFIG)
+    if not config['history_enabled']:
+        return False
+    
+    record = dict(translation_record)
+    record.setdefault('timestamp', datetime.now(timezone.utc).isoformat())
+    
+    try:
+        db = _get_history_db()
+        db.execute('INSERT INTO history (timestamp, source_lang, target_lang, '
+                   'source_text, translated_text) VALUES (?, ?, ?, ?, ?)',
+                   tuple(record.get(column) for column in _HISTORY_COLUMNS))
+        if config['max_history']:
+            db.execute('DELETE FROM history WHERE rowid <= (SELECT rowid FROM history '
+                       'ORDER BY rowid DESC LIMIT 1 OFFSET ?)', (config['max_history'],))
+    except (sqlite3.Error, OSError):
+        return False
+    return True
+
+
+_history_db = None
+
+
+def _get_history_db(create: bool = True):
+    """
+    Open the SQLite history database, once per process.
+    
+    Inputs:
+        create (bool): Create history.db if it does not exist yet; readers
+            pass False so looking at history never creates anything
+    
+    Outputs:
+        sqlite3.Connection: Autocommit connection in WAL mode
+    
+    Expected Behavior:
+        - When creating, open the file first with user-only permissions
+          (0600), making the config directory only if that fails; SQLite
+          gives the -wal and -shm files the same permissions
+        - Connect with mode=rw, so a missing file is an error rather than
+          a new world-readable database
+        - On first use of a new database, create the history table, the
+          covering index on (timestamp DESC, source_lang, target_lang) and
+          the per-language indexes
+    
+    Raises:
+        sqlite3.Error: If the database cannot be opened or initialized
+        OSError: If history.db cannot be created
+    """
+    global _history_db
+    if _history_db is not None:
+        return _history_db
+    
+    import sqlite3
+    from urllib.parse import quote
+    if create:
+        _open_for_write(HISTORY_FILE, 'ab', opener=_private_opener).close()
+    db = sqlite3.connect(f"file:{quote(HISTORY_FILE)}?mode=rw", uri=True,
+                         isolation_level=None)
+    db.execute('PRAGMA journal_mode=WAL')
+    if db.execute('PRAGMA user_version').fetchone()[0] < _HISTORY_SCHEMA_VERSION:
+        _init_history_db(db)
+    _history_db = db
+    return db
+
+
+def _init_history_db(db) -> None:
+    """Create or upgrade the history schema: tables and indexes only."""
+    db.execute('BEGIN IMMEDIATE')
+    try:
+        # Another process may have upgraded it while we waited for the lock
+        version = db.execute('PRAGMA user_version').fetchone()[0]
+        if version < 1:
+            db.execute('CREATE TABLE IF NOT EXISTS history (timestamp TEXT, '
+                       'source_lang TEXT, target_lang TEXT, source_text TEXT, '
+                       'translated_text TEXT)')
+            db.execute('CREATE INDEX IF NOT EXISTS history_recent ON history '
+                       '(timestamp DESC, source_lang, target_lang)')
+        if version < 2:
+            # Per-language indexes let filtered lookups seek straight to
+            # matching rows instead of scanning past other languages
+            db.execute('CREATE INDEX IF NOT EXISTS history_source ON history '
+                       '(source_lang, timestamp DESC)')
+            db.execute('CREATE INDEX IF NOT EXISTS history_target ON history '
+                       '(target_lang, timestamp DESC)')
+        db.execute(f'PRAGMA user_version = {_HISTORY_SCHEMA_VERSION}')
+        db.execute('COMMIT')
+    except BaseException:
+        db.execute('ROLLBACK')
+        raise
 
 
 def get_history(limit: int = 100, filter_lang: Optional[str] = None) -> List[Dict]:
@@ -459,17 +1509,45 @@ def get_history(limit: int = 100, filter_lang: Optional[str] = None) -> List[Dic
         list of dict: List of translation records, newest first
     
     Expected Behavior:
-        - Load history from storage
-        - Filter by language if specified
-        - Sort by timestamp (newest first)
-        - Limit results to specified count
-        - Return empty list if no history
-        - Handle corrupted history gracefully
+        - Unfiltered: walk the timestamp index newest first and stop after
+          limit rows
+        - Filter by language if specified: take the newest limit rows from
+          each of the (source_lang, timestamp) and (target_lang, timestamp)
+          indexes and merge them, so even a rarely used language costs
+          O(limit) index seeks rather than a scan of the whole history
+        - Return empty list if no history, without creating history.db
+        - Leave out fields a record was saved without
     
     Raises:
         None (returns empty list on error)
     """
-    pass
+    import sqlite3
+    
+    if limit <= 0:
+        return []
+    
+    columns = 'timestamp, source_lang, target_lang, source_text, translated_text'
+    try:
+        db = _get_history_db(create=False)
+        if filter_lang is None:
+            rows = db.execute(
+                f'SELECT {columns} FROM history INDEXED BY history_recent '
+                f'ORDER BY timestamp DESC LIMIT ?', (limit,)).fetchall()
+        else:
+            # rowid keeps UNION from merging distinct but identical records
+            rows = db.execute(
+                f'SELECT {columns} FROM ('
+                f'SELECT * FROM (SELECT rowid, {columns} FROM history INDEXED BY history_source '
+                f'WHERE source_lang = ? ORDER BY timestamp DESC LIMIT ?) '
+                f'UNION '
+                f'SELECT * FROM (SELECT rowid, {columns} FROM history INDEXED BY history_target '
+                f'WHERE target_lang = ? ORDER BY timestamp DESC LIMIT ?)'
+                f') ORDER BY timestamp DESC LIMIT ?',
+                (filter_lang, limit, filter_lang, limit, limit)).fetchall()
+    except sqlite3.Error:
+        return []
+    return [{column: value for column, value in zip(_HISTORY_COLUMNS, row)
+             if value is not None} for row in rows]
 
 
 def clear_history() -> bool:
@@ -516,12 +1594,21 @@ def display_translation(translation: Dict, show_details: bool = False) -> None:
         - Optionally show confidence score
         - Use colors for better readability (if terminal supports it)
         - Handle long text with proper wrapping
-        - Format for easy copy-paste
+        - Format for easy copy-paste: the translation is printed alone on
+          its own lines, details go underneath
     
     Raises:
         None
     """
-    pass
+    lines = [translation['translated_text']]
+    if show_details:
+        details = (f"{get_language_name(translation['source_language'])} -> "
+                   f"{get_language_name(translation['target_language'])} "
+                   f"via {translation['api_provider']}")
+        if translation.get('confidence') is not None:
+            details += f", confidence {translation['confidence']:.0%}"
+        lines.append(f"  ({details})")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def display_languages(languages: List[Dict]) -> None:
@@ -536,15 +1623,31 @@ def display_languages(languages: List[Dict]) -> None:
     
     Expected Behavior:
         - Display in columns: Code | Name | Native Name
-        - Sort alphabetically by name
-        - Format as readable table with alignment
-        - Paginate if list is very long
+        - Sort alphabetically by name (unless already sorted)
+        - Measure column widths in one pass, then format every row with
+          them
+        - Emit the whole table with a single sys.stdout.write, so piping
+          into a pager or head sees one large write
         - Group by language family (optional enhancement)
     
     Raises:
         None
     """
-    pass
+    if not languages:
+        sys.stdout.write("No languages available.\n")
+        return
+    
+    if any(a['name'] > b['name'] for a, b in zip(languages, languages[1:])):
+        languages = sorted(languages, key=lambda lang: lang['name'])
+    code_width = max(4, max(len(lang['code']) for lang in languages))
+    name_width = max(4, max(len(lang['name']) for lang in languages))
+    
+    lines = [f"{'Code':<{code_width}}  {'Name':<{name_width}}  Native Name",
+             f"{'-' * code_width}  {'-' * name_width}  {'-' * 11}"]
+    lines.extend(f"{lang['code']:<{code_width}}  {lang['name']:<{name_width}}  "
+                 f"{lang['native_name']}" for lang in languages)
+    lines.append(f"\n{len(languages)} languages")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def display_history(history: List[Dict]) -> None:
@@ -562,13 +1665,40 @@ def display_history(history: List[Dict]) -> None:
         - Display: timestamp, source->target languages, snippet of text
         - Truncate long translations
         - Number the entries
-        - Format timestamps in friendly way ("2 hours ago")
+        - Format timestamps in friendly way ("2 hours ago"), all relative
+          to a single clock reading
         - Use table format for clarity
+        - Build every row first and emit them with one sys.stdout.write
     
     Raises:
         None
     """
-    pass
+    import time
+    
+    if not history:
+        sys.stdout.write("No translation history yet.\n")
+        return
+    
+    now = time.time()
+    lines = [f"{'#':>3}  {'When':<22}  {'Languages':<14}  Text",
+             f"{'-' * 3}  {'-' * 22}  {'-' * 14}  {'-' * 60}"]
+    for number, record in enumerate(history, 1):
+        try:
+            when = format_timestamp(record.get('timestamp', ''), now)
+        except ValueError:
+            when = record.get('timestamp') or 'unknown time'
+        langs = f"{record.get('source_lang', '?'):>5} -> {record.get('target_lang', '?'):<5}"
+        lines.append(f"{number:>3}  {when:<22}  {langs:<14}  "
+                     f"{_truncate(record.get('source_text', ''))}".rstrip())
+        lines.append(f"{'':>3}  {'':<22}  {'':<14}  "
+                     f"{_truncate(record.get('translated_text', ''))}".rstrip())
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def _truncate(text: str, width: int = 60) -> str:
+    """Collapse text onto one line and cut it to width characters."""
+    text = ' '.join(text.split())
+    return text if len(text) <= width else text[:width - 3] + '...'
 
 
 # ============================================================================
@@ -600,11 +1730,86 @@ def interactive_mode(config: Dict) -> None:
                 - 'help' or '?': show help
         - Handle Ctrl+C gracefully
         - Provide clear feedback for all actions
+        - Open the connection to the provider in the background while the
+          welcome message is shown, so the first translation is not
+          slowed by the TCP/TLS handshake
+        - Once setup is done, collect garbage and gc.freeze() what is left,
+          so the long-lived tables and sessions are not rescanned by every
+          collection while the prompt sits idle
     
     Raises:
         KeyboardInterrupt: Handle gracefully and exit cleanly
     """
-    pass
+    source = config['default_source']
+    target = config['default_target']
+    provider = config['api_provider']
+    
+    import gc
+    
+    _prewarm_session(provider)
+    print("CLI Translator - interactive mode")
+    print(_INTERACTIVE_HELP)
+    
+    # The prompt session (and the language table it completes from) lives
+    # as long as the loop, so create it before freezing
+    _get_prompt_session(config)
+    gc.collect()
+    gc.freeze()
+    
+    while True:
+        try:
+            text = prompt_for_input(f"[{source} -> {target}]")
+        except (KeyboardInterrupt, EOFError):
+            print()
+            break
+        
+        command = text.lower()
+        if not text:
+            continue
+        if command in ('q', 'quit'):
+            break
+        if command in ('?', 'help'):
+            print(_INTERACTIVE_HELP)
+        elif command in ('s', 'swap'):
+            if source == 'auto':
+                print("Can't swap while the source language is 'auto'.")
+            else:
+                source, target = target, source
+                print(f"Now translating {source} -> {target}")
+        elif command in ('c', 'change'):
+            try:
+                new_source = prompt_for_input(f"Source language [{source}]") or source
+                new_target = prompt_for_input(f"Target language [{target}]") or target
+            except (KeyboardInterrupt, EOFError):
+                print()
+                continue
+            if not validate_language_code(new_source, provider):
+                print(f"Unsupported language: {new_source}")
+            elif (new_target.lower() == 'auto'
+                  or not validate_language_code(new_target, provider)):
+                print(f"Unsupported language: {new_target}")
+            else:
+                source, target = new_source, new_target
+                print(f"Now translating {source} -> {target}")
+        elif command in ('h', 'history'):
+            display_history(get_history(limit=10))
+        else:
+            try:
+                display_translation(translate_text(text, source, target, provider, config))
+            except KeyboardInterrupt:
+                print()
+            except (TranslationError, ValueError, OSError) as e:
+                handle_error(e, "translation")
+    
+    print("Goodbye!")
+
+
+_INTERACTIVE_HELP = """Type text to translate it. Commands:
+  s, swap      swap source and target languages
+  c, change    change languages
+  h, history   show recent translations
+  ?, help      show this help
+  q, quit      exit (or Ctrl+D)"""
 
 
 def prompt_for_input(prompt_message: str = "Enter text to translate") -> str:
@@ -619,7 +1824,11 @@ def prompt_for_input(prompt_message: str = "Enter text to translate") -> str:
     
     Expected Behavior:
         - Display prompt message
-        - Read user input
+        - Read user input, through prompt_toolkit when it is installed and
+          stdin is a terminal: line editing, persistent input history
+          (Ctrl-R searches it, kept on disk only when history_enabled is
+          set) and Tab completion of language codes and
+          commands; plain input() otherwise
         - Handle empty input (re-prompt or return empty)
         - Support multi-line input (optional)
         - Strip leading/trailing whitespace
@@ -628,19 +1837,74 @@ def prompt_for_input(prompt_message: str = "Enter text to translate") -> str:
         KeyboardInterrupt: If user presses Ctrl+C
         EOFError: If EOF is reached
     """
-    pass
+    session = _get_prompt_session()
+    if session is not None:
+        return session.prompt(f"{prompt_message}: ").strip()
+    return input(f"{prompt_message}: ").strip()
+
+
+_prompt_session = None
+
+
+def _get_prompt_session(config: Optional[Dict] = None):
+    """
+    Create the prompt_toolkit session on first use; None if unavailable.
+    
+    Inputs:
+        config (dict, optional): Settings from load_config(); read from the
+            config file when omitted
+    
+    Outputs:
+        prompt_toolkit.PromptSession or None: None when prompt_toolkit is
+        not installed or stdin is not a terminal (e.g. piped input)
+    
+    Expected Behavior:
+        - Complete language codes from the generated _languages table and
+          interactive commands on Tab, with no network access
+        - Keep input history in ~/.cli-translator/prompt_history (created
+          0600) only when history_enabled is set; in memory otherwise
+    """
+    global _prompt_session
+    if _prompt_session is None:
+        _prompt_session = False
+        if sys.stdin.isatty():
+            try:
+                from prompt_toolkit import PromptSession
+                from prompt_toolkit.completion import WordCompleter
+                from prompt_toolkit.history import FileHistory, InMemoryHistory
+            except ImportError:
+                return None
+            from _languages import VALID_CODES
+            
+            if config is None:
+                config = load_config()
+            if config['history_enabled']:
+                # FileHistory appends with the umask's permissions, so
+                # create the file user-only first
+                _open_for_write(PROMPT_HISTORY_FILE, 'ab', opener=_private_opener).close()
+                history = FileHistory(PROMPT_HISTORY_FILE)
+            else:
+                history = InMemoryHistory()
+            words = sorted(VALID_CODES) + ['auto', 'swap', 'change', 'history',
+                                           'help', 'quit']
+            _prompt_session = PromptSession(
+                completer=WordCompleter(words, ignore_case=True),
+                complete_while_typing=False,
+                history=history)
+    return _prompt_session or None
 
 
 # ============================================================================
 # COMMAND-LINE INTERFACE
 # ============================================================================
 
-def parse_arguments() -> argparse.Namespace:
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """
     Parse command-line arguments.
     
     Inputs:
-        None (reads from sys.argv)
+        argv (list of str, optional): Arguments to parse; defaults to
+            sys.argv[1:]
     
     Outputs:
         argparse.Namespace: Parsed arguments object with attributes:
@@ -655,7 +1919,8 @@ def parse_arguments() -> argparse.Namespace:
             - config: bool
     
     Expected Behavior:
-        - Define all command-line arguments with help text
+        - Define all command-line arguments with help text, building the
+          parser once per process (see _build_parser)
         - Set appropriate defaults
         - Handle conflicting arguments (e.g., text and file both specified)
         - Provide clear help message
@@ -665,7 +1930,44 @@ def parse_arguments() -> argparse.Namespace:
     Raises:
         SystemExit: If --help or invalid arguments (handled by argparse)
     """
-    pass
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    
+    if args.text is not None and args.file is not None:
+        parser.error('cannot translate text and --file at the same time')
+    if args.output is not None and args.file is None:
+        parser.error('--output requires --file')
+    
+    return args
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser on first use and reuse it afterwards."""
+    parser = argparse.ArgumentParser(
+        prog='translator.py',
+        description='Translate text between languages from the command line.')
+    parser.add_argument('text', nargs='?',
+                        help='Text to translate')
+    parser.add_argument('--source', '-s',
+                        help="Source language code (e.g., 'en', 'es', 'fr')")
+    parser.add_argument('--target', '-t',
+                        help="Target language code (e.g., 'en', 'es', 'fr')")
+    parser.add_argument('--interactive', '-i', action='store_true',
+                        help='Start interactive translation mode')
+    parser.add_argument('--file', '-f',
+                        help='Translate text from a file')
+    parser.add_argument('--output', '-o',
+                        help='Output file for translation')
+    parser.add_argument('--list-languages', '-l', action='store_true',
+                        help='List all supported languages')
+    parser.add_argument('--history', action='store_true',
+                        help='Show translation history')
+    parser.add_argument('--config', '-c', action='store_true',
+                        help='Configure translator settings')
+    parser.add_argument('--version', action='version',
+                        version=f'%(prog)s {__version__}')
+    return parser
 
 
 def main():
@@ -698,7 +2000,96 @@ def main():
     Raises:
         None (catches all exceptions and exits gracefully)
     """
-    pass
+    args = parse_arguments()
+    
+    # Commands that don't need settings run before the config file is
+    # touched; everything else reads it on first access.
+    if args.history:
+        display_history(get_history())
+        return
+    
+    config = _LazyConfig()
+    
+    try:
+        if args.config:
+            setup_first_run()
+            return
+        
+        if args.list_languages:
+            provider = config['api_provider']
+            display_languages(get_supported_languages(
+                provider, get_api_key(provider, config.load()) or ''))
+            return
+        
+        # The wizard needs someone to answer it; scripts and pipes run on
+        # defaults plus whatever key the environment provides
+        if (config.missing and sys.stdin.isatty()
+                and not get_api_key(config['api_provider'], config.load())):
+            config.set(setup_first_run())
+        
+        source = args.source or config['default_source']
+        target = args.target or config['default_target']
+        provider = config['api_provider']
+        
+        if args.interactive:
+            interactive_mode(config.load())
+        elif args.file:
+            output = args.output
+            if output is None:
+                base, ext = os.path.splitext(args.file)
+                output = f"{base}.{target}{ext}"
+            summary = translate_file(args.file, output, source, target, provider,
+                                     config.load())
+            lines = summary['total_lines']
+            print(f"Translated {lines} line{'' if lines == 1 else 's'} "
+                  f"({summary['total_chars']} characters) to {output} "
+                  f"in {summary['time_taken']:.1f}s")
+        elif args.text:
+            display_translation(translate_text(args.text, source, target, provider,
+                                               config.load()))
+        else:
+            print("Nothing to translate. Run with --help for usage.", file=sys.stderr)
+            sys.exit(2)
+    except KeyboardInterrupt:
+        sys.exit(130)
+    except ConfigError as e:
+        handle_error(e, "config")
+        sys.exit(1)
+    except ValueError as e:
+        handle_error(e, "arguments")
+        sys.exit(2)
+    except Exception as e:
+        handle_error(e, "main")
+        sys.exit(1)
+
+
+class _LazyConfig:
+    """Defers load_config() until the first time a setting is read."""
+    
+    def __init__(self):
+        self._config = None
+        self._found = False
+    
+    def load(self) -> Dict:
+        if self._config is None:
+            try:
+                self._config, self._found = _read_config()
+            except ValueError as e:
+                raise ConfigError(str(e)) from e
+        return self._config
+    
+    def set(self, config: Dict) -> Dict:
+        self._config, self._found = config, True
+        return config
+    
+    @property
+    def missing(self) -> bool:
+        """True when load() found no config.json to read."""
+        self.load()
+        return not self._found
+    
+    def __getitem__(self, key):
+        return self.load()[key]
 
 
 # ============================================================================
@@ -724,45 +2115,153 @@ def validate_text_length(text: str, max_length: int = 5000) -> bool:
     Raises:
         None (returns bool)
     """
-    pass
+    return bool(text.strip()) and len(text) <= max_length
 
 
-def chunk_text(text: str, chunk_size: int = 5000) -> List[str]:
+def chunk_text(text: Union[str, Iterable[str]], chunk_size: int = 5000) -> Iterator[str]:
     """
     Split long text into chunks for translation.
     
     Inputs:
-        text (str): Text to split
+        text (str or iterable of str): Text to split, or consecutive pieces
+            of it (e.g. read_file_content(..., streaming=True))
         chunk_size (int): Maximum size of each chunk
     
     Outputs:
-        list of str: Text chunks
+        iterator of str: Text chunks, produced lazily
     
     Expected Behavior:
         - Split text into chunks of approximately chunk_size
-        - Try to split at sentence boundaries (. ! ?)
+        - Try to split at sentence boundaries (. ! ?) or line breaks
         - If no sentence boundaries, split at word boundaries
         - Preserve paragraph breaks where possible
         - Last chunk may be smaller
+        - Chunks concatenate back to exactly the original text
+        - Walk the text once with a compiled regex instead of repeatedly
+          searching and re-slicing the remainder
+        - Given pieces, produce exactly the chunks the joined text would,
+          holding back only the unfinished sentence at the end of each one
     
     Raises:
         None
     """
-    pass
-
-
-def format_timestamp(timestamp: str) -> str:
+    if isinstance(text, str):
+        pieces = _text_pieces(text, chunk_size)
+    else:
+        pieces = _stream_pieces(text, chunk_size)
+    
+    buf = []
+    size = 0
+    for piece in pieces:
+        if size + len(piece) > chunk_size and buf:
+            yield ''.join(buf)
+            buf = []
+            size = 0
+        buf.append(piece)
+        size += len(piece)
+    if buf:
+        yield ''.join(buf)
+
+
+# A sentence (or line) with its terminators and trailing whitespace; every
+# position in the text starts a match, so matches tile the whole string
+_SENTENCE_RE = re.compile(r'[^.!?\n]+[.!?\n]*\s*|[.!?\n]+\s*')
+_WORD_RE = re.compile(r'\S+\s*|\s+')
+
+
+def _text_pieces(text: str, chunk_size: int) -> Iterator[str]:
+    """Yield sentences, falling back to words then hard cuts, none over chunk_size."""
+    for match in _SENTENCE_RE.finditer(text):
+        yield from _sentence_pieces(match.group(), chunk_size)
+
+
+def _sentence_pieces(sentence: str, chunk_size: int, split: bool = False) -> Iterator[str]:
+    """Yield a sentence whole if it fits (and split is False), else by words."""
+    if len(sentence) <= chunk_size and not split:
+        yield sentence
+        return
+    for match in _WORD_RE.finditer(sentence):
+        word = match.group()
+        if len(word) <= chunk_size:
+            yield word
+            continue
+        for pos in range(0, len(word), chunk_size):
+            yield word[pos:pos + chunk_size]
+
+
+def _stream_pieces(parts: Iterable[str], chunk_size: int) -> Iterator[str]:
+    """
+    _text_pieces over consecutive parts of a text, as if they were joined.
+    
+    Only the last sentence of what has arrived so far can still change, so
+    it is held back and re-matched with the next part. Once that sentence
+    is longer than chunk_size it will be split by words whatever follows,
+    so all but its last word are released; from then on the sentence is
+    followed with _SENTENCE_STAGES rather than re-matched from its start.
+    """
+    tail = ''
+    stage = None  # _SENTENCE_STAGES index while tail ends a long sentence
+    for part in parts:
+        if stage is not None:
+            stage, pos = _advance_sentence(part, stage)
+            pieces = list(_sentence_pieces(tail + part[:pos], chunk_size, True))
+            if pos == len(part):
+                yield from pieces[:-1]
+                tail = pieces[-1]
+                continue
+            yield from pieces
+            tail = ''
+            stage = None
+            part = part[pos:]
+        if not part:
+            continue
+        
+        sentences = [match.group() for match in _SENTENCE_RE.finditer(tail + part)]
+        for sentence in sentences[:-1]:
+            yield from _sentence_pieces(sentence, chunk_size)
+        tail = sentences[-1]
+        if len(tail) > chunk_size:
+            stage = _advance_sentence(tail, 0)[0]
+            pieces = list(_sentence_pieces(tail, chunk_size, True))
+            yield from pieces[:-1]
+            tail = pieces[-1]
+    if tail:
+        yield from _sentence_pieces(tail, chunk_size, stage is not None)
+
+
+# The three runs of a _SENTENCE_RE match: text, terminators, whitespace
+_SENTENCE_STAGES = (re.compile(r'[^.!?\n]*'), re.compile(r'[.!?\n]*'), re.compile(r'\s*'))
+
+
+def _advance_sentence(text: str, stage: int) -> Tuple[int, int]:
+    """Continue a sentence from stage through text; return (stage, end)."""
+    pos = 0
+    for index in range(stage, len(_SENTENCE_STAGES)):
+        end = _SENTENCE_STAGES[index].match(text, pos).end()
+        if end > pos:
+            stage = index
+            pos = end
+        if pos == len(text):
+            break
+    return stage, pos
+
+
+def format_timestamp(timestamp: str, now: Optional[float] = None) -> str:
     """
     Format ISO timestamp into human-readable format.
     
     Inputs:
         timestamp (str): ISO format timestamp
+        now (float, optional): Current epoch time; callers formatting many
+            timestamps read the clock once and pass it in
     
     Outputs:
         str: Human-readable time (e.g., "2 hours ago", "Yesterday at 3:45 PM")
     
     Expected Behavior:
-        - Parse ISO timestamp
+        - Parse the ISO timestamp with a compiled regex and integer
+          arithmetic rather than datetime; timestamps without an offset
+          are taken as UTC
         - Calculate time difference from now
         - Format as relative time for recent translations
         - Format as absolute time for old translations
@@ -771,7 +2270,54 @@ def format_timestamp(timestamp: str) -> str:
     Raises:
         ValueError: If timestamp format is invalid
     """
-    pass
+    import time
+    
+    match = _TIMESTAMP_RE.match(timestamp)
+    if match is None:
+        raise ValueError(f"Invalid timestamp: {timestamp!r}")
+    year, month, day, hour, minute, second = map(int, match.group(1, 2, 3, 4, 5, 6))
+    if not (1 <= month <= 12 and 1 <= day <= 31 and hour < 24 and minute < 60
+            and second < 61):
+        raise ValueError(f"Invalid timestamp: {timestamp!r}")
+    
+    epoch = (_days_from_civil(year, month, day) * 86400
+             + hour * 3600 + minute * 60 + second)
+    offset = match.group(7)
+    if offset and offset != 'Z':
+        sign = -1 if offset[0] == '-' else 1
+        epoch -= sign * (int(offset[1:3]) * 3600 + int(offset[-2:]) * 60)
+    
+    if now is None:
+        now = time.time()
+    delta = now - epoch
+    if delta < 60:
+        return "just now"
+    if delta < 3600:
+        minutes = int(delta // 60)
+        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
+    if delta < 86400:
+        hours = int(delta // 3600)
+        return f"{hours} hour{'s' if hours != 1 else ''} ago"
+    local = time.localtime(epoch)
+    if delta < 2 * 86400:
+        return "Yesterday at " + time.strftime('%I:%M %p', local).lstrip('0')
+    if delta < 7 * 86400:
+        return f"{int(delta // 86400)} days ago"
+    return time.strftime('%b %d, %Y', local)
+
+
+_TIMESTAMP_RE = re.compile(
+    r'(\d{4})-(\d\d)-(\d\d)[T ](\d\d):(\d\d):(\d\d)(?:\.\d+)?(Z|[+-]\d\d:?\d\d)?$')
+
+
+def _days_from_civil(year: int, month: int, day: int) -> int:
+    """Days since 1970-01-01 for a proleptic Gregorian date."""
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
 
 
 def get_language_name(lang_code: str) -> str:
@@ -785,7 +2331,7 @@ def get_language_name(lang_code: str) -> str:
         str: Full language name (e.g., 'English', 'Spanish')
     
     Expected Behavior:
-        - Look up language code in mapping dictionary
+        - Look up language code in the generated LANG_NAMES mapping
         - Return full name if found
         - Return code itself if not found
         - Handle case variations
@@ -793,7 +2339,8 @@ def get_language_name(lang_code: str) -> str:
     Raises:
         None (returns code if not found)
     """
-    pass
+    from _languages import LANG_NAMES
+    return LANG_NAMES.get(lang_code.lower(), lang_code)
 
 
 # ============================================================================
@@ -820,6 +2367,11 @@ class AuthenticationError(TranslationError):
     pass
 
 
+class ConfigError(Exception):
+    """The configuration file exists but cannot be used."""
+    pass
+
+
 def handle_error(error: Exception, context: str = "") -> None:
     """
     Handle and display errors to user in friendly way.
@@ -841,7 +2393,31 @@ def handle_error(error: Exception, context: str = "") -> None:
     Raises:
         None
     """
-    pass
+    if isinstance(error, AuthenticationError):
+        hint = "Check your API key with --config."
+    elif isinstance(error, ConfigError):
+        hint = f"Fix or delete {CONFIG_FILE}, or rewrite it with --config."
+    elif isinstance(error, RateLimitError):
+        hint = "Wait a moment before trying again."
+    elif isinstance(error, FileNotFoundError):
+        hint = "Check the file path."
+    elif isinstance(error, PermissionError):
+        hint = "Check the file permissions."
+    elif isinstance(error, ValueError):
+        hint = "Use --list-languages to see supported language codes."
+    elif isinstance(error, OSError):
+        # requests' network errors are OSError subclasses
+        hint = "Check your internet connection."
+    else:
+        hint = ""
+    
+    # Exception text can echo request URLs, which carry the key for Google
+    message = re.sub(r'(key=)[^&\s]+', r'\1***', str(error) or type(error).__name__)
+    
+    prefix = f"Error ({context})" if context else "Error"
+    print(f"{prefix}: {message}", file=sys.stderr)
+    if hint:
+        print(hint, file=sys.stderr)
 
 
 # ============================================================================